@@ -0,0 +1,65 @@
+"""Timing benchmark for the offline extractive report engine.
+
+Items are generated from the vocabulary of full_report.html (real AI-news
+wording, so terms like "ai", "model" and "openai" are frequent) plus a
+Zipf-distributed tail of rare words, which is the case that makes naive
+inverted-index clustering quadratic.
+
+    python -m benchmarks.extractive_bench [n_items ...]
+"""
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+import itertools
+import os
+import random
+import re
+import sys
+import time
+
+from src.extractive import make_extractive_report
+from src.news_types import NewsItem
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _vocabulary() -> list[str]:
+    with open(os.path.join(_ROOT, "full_report.html"), "r", encoding="utf-8") as f:
+        text = re.sub(r"<[^>]+>", " ", f.read())
+    return re.findall(r"[A-Za-z][A-Za-z\-]+", text)
+
+
+def make_items(n: int, seed: int = 0) -> list[NewsItem]:
+    rng = random.Random(seed)
+    report_words = _vocabulary()
+    tail = [f"term{i}" for i in range(20000)]
+    zipf_cum = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(tail))))
+    now = datetime.now(timezone.utc)
+
+    def sentence(length: int) -> str:
+        words = [rng.choice(report_words) if rng.random() < 0.6 else rng.choices(tail, cum_weights=zipf_cum)[0] for _ in range(length)]
+        return " ".join(words).capitalize() + "."
+
+    return [
+        NewsItem(
+            title=sentence(rng.randint(6, 12)).rstrip("."),
+            url=f"https://example.com/{i}",
+            source=rng.choice(["TechCrunch", "r/machinelearning", "@openai", "arXiv"]),
+            published_at=now - timedelta(minutes=i),
+            summary=" ".join(sentence(rng.randint(10, 25)) for _ in range(rng.randint(2, 5))),
+            image_url=None,
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 3000, 5000]
+    for n in sizes:
+        items = make_items(n)
+        start = time.perf_counter()
+        make_extractive_report(items, {})
+        print(f"{n:>6} items: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
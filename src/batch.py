@@ -0,0 +1,156 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+
+from .config import load_config
+from .news_types import NewsItem
+from .cli import enrich_articles, select_items, send_email, sort_items
+from .consolidate import make_report
+from .db import configure_recipient_sync
+from .fetchers.rss import fetch_from_rss
+from .fetchers.reddit import fetch_from_reddit
+from .fetchers.discord_fetcher import fetch_from_discord
+from .fetchers.twitter import fetch_from_twitter
+from .fetchers.images import attach_og_images
+from .fetchers.transport import configure_transport
+from .source_health import SourceHealth
+
+# (kind, identifier...) -> items fetched once for every digest that lists it
+SourceKey = Tuple[str, ...]
+
+
+def _source_keys(config: Dict[str, Any]) -> Dict[SourceKey, int]:
+    """Sources a single config asks for, with the per-source item cap it wants."""
+    sources = config.get("sources", {}) or {}
+    opts = config.get("options", {}) or {}
+    keys: Dict[SourceKey, int] = {}
+    for url in sources.get("rss_urls", []) or []:
+        keys[("rss", url)] = int(opts.get("rss_max_per_feed", 15))
+    for sub in sources.get("reddit_subreddits", []) or []:
+        keys[("reddit", sub.lower())] = int(opts.get("reddit_limit", 15))
+    for account in sources.get("twitter_accounts", []) or []:
+        keys[("twitter", account)] = int(opts.get("twitter_max_per_account", 15))
+    discord_cfg = sources.get("discord", {}) or {}
+    if discord_cfg.get("enabled") and discord_cfg.get("bot_token"):
+        for cid in discord_cfg.get("channel_ids") or []:
+            keys[("discord", discord_cfg["bot_token"], str(cid))] = int(discord_cfg.get("per_channel_limit") or 50)
+    return keys
+
+
+def _fetcher_for(key: SourceKey, cap: int, configs: List[Dict[str, Any]], health: SourceHealth, timeout: float) -> Callable[[], List[NewsItem]]:
+    kind = key[0]
+    if kind == "rss":
+        return lambda: fetch_from_rss([key[1]], max_items_per_feed=cap, timeout=timeout, health=health)
+    if kind == "reddit":
+        return lambda: fetch_from_reddit([key[1]], limit=cap, timeout=timeout)
+    if kind == "twitter":
+        instances: List[str] = []
+        for cfg in configs:
+            for inst in cfg.get("sources", {}).get("nitter_instances") or []:
+                if inst not in instances:
+                    instances.append(inst)
+        return lambda: fetch_from_twitter([key[1]], nitter_instances=instances, max_items_per_account=cap, timeout=timeout)
+    return lambda: fetch_from_discord(key[1], [key[2]], per_channel_limit=cap, timeout=timeout)
+
+
+def fetch_shared(configs: List[Dict[str, Any]], health: SourceHealth, max_workers: int = 16) -> Dict[SourceKey, List[NewsItem]]:
+    """Fetch the union of all configs' sources, each exactly once, concurrently.
+    Each source is fetched with the largest cap any config asks for."""
+    caps: Dict[SourceKey, int] = {}
+    for cfg in configs:
+        for key, cap in _source_keys(cfg).items():
+            caps[key] = max(cap, caps.get(key, 0))
+    timeout = float(configs[0].get("options", {}).get("fetch_timeout_sec", 15))
+
+    def run(key: SourceKey) -> List[NewsItem]:
+        try:
+            return _fetcher_for(key, caps[key], configs, health, timeout)()
+        except Exception as e:
+            print(f"[Batch] Failed to fetch {key[0]} source {key[-1]}: {e}")
+            return []
+
+    keys = list(caps)
+    print(f"[Batch] Fetching {len(keys)} unique sources for {len(configs)} digests")
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        return dict(zip(keys, pool.map(run, keys)))
+
+
+def items_for(config: Dict[str, Any], fetched: Dict[SourceKey, List[NewsItem]]) -> List[NewsItem]:
+    """The shared items this config would have fetched on its own, after its filters.
+    Items are copied so per-digest enrichment (images, article text) cannot leak
+    into other digests."""
+    items: List[NewsItem] = []
+    for key, cap in _source_keys(config).items():
+        items.extend(replace(it) for it in fetched.get(key, [])[:cap])
+    return select_items(items, config)
+
+
+def run_batch(config_paths: List[str], report_dir: Optional[str] = None, send: bool = False) -> Dict[str, str]:
+    """Build one report per config from a single shared fetch. Returns {config name: report}."""
+    configs = [load_config(p) for p in config_paths]
+    names = [os.path.splitext(os.path.basename(p))[0] for p in config_paths]
+    # Transport, source health and recipients are process-wide; the first config sets them up
+    transport = configure_transport(configs[0])
+    if send:
+        configure_recipient_sync(configs[0]).start_background()
+
+    health = SourceHealth.from_config(configs[0])
+    fetched = fetch_shared(configs, health, max_workers=int(configs[0].get("http", {}).get("pool_maxsize", 16)))
+    health.save()
+
+    selected = [items_for(cfg, fetched) for cfg in configs]
+
+    # Each digest enriches its own copies with its own budget; pages read by an
+    # earlier digest come from the article cache instead of the network
+    pages_read: List[set[str]] = []
+    for cfg, items in zip(configs, selected):
+        enabled = bool(cfg.get("articles", {}).get("enabled", False))
+        pages_read.append(enrich_articles(items, cfg) if enabled else set())
+
+    # Images found while reading article pages are reused; every other
+    # OpenGraph image is looked up once and given only to digests that want images
+    wants_images = [bool(cfg.get("options", {}).get("fetch_images", False)) for cfg in configs]
+    found: Dict[str, Optional[str]] = {}
+    for wants, items, read in zip(wants_images, selected, pages_read):
+        if wants:
+            found.update((it.url, it.image_url) for it in items if it.url in read)
+    probes: Dict[str, NewsItem] = {}
+    for wants, items in zip(wants_images, selected):
+        if wants:
+            for it in items:
+                if it.url and not it.image_url and it.url not in found:
+                    probes.setdefault(it.url, replace(it))
+    if probes:
+        attach_og_images(probes.values(), timeout=configs[0].get("options", {}).get("fetch_timeout_sec", 15))
+    found.update((url, probe.image_url) for url, probe in probes.items())
+    for wants, items in zip(wants_images, selected):
+        if wants:
+            for it in items:
+                if not it.image_url and found.get(it.url):
+                    it.image_url = found[it.url]
+
+    print(transport.summary())
+
+    for items in selected:
+        sort_items(items)
+
+    with ThreadPoolExecutor(max_workers=len(configs)) as pool:
+        reports = list(pool.map(make_report, selected, configs))
+
+    results: Dict[str, str] = {}
+    for name, cfg, items, report in zip(names, configs, selected, reports):
+        print(f"[Batch] {name}: {len(items)} items")
+        results[name] = report
+        if report_dir and report:
+            os.makedirs(report_dir, exist_ok=True)
+            path = os.path.join(report_dir, f"{name}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(report)
+            print(f"Wrote report to {path}")
+        if send and report:
+            subject = f"News Report - {datetime.now().strftime('%Y-%m-%d')}"
+            send_email(cfg, subject, report)
+    return results
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta, timezone
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from .db import get_recipients
+from .db import get_recipients, configure_recipient_sync
 
 from .config import load_config
 from .news_types import NewsItem
@@ -12,8 +12,11 @@ from .fetchers.rss import fetch_from_rss
 from .fetchers.reddit import fetch_from_reddit
 from .fetchers.discord_fetcher import fetch_from_discord
 from .fetchers.twitter import fetch_from_twitter
-from .consolidate import make_report
+from .consolidate import make_report, select_for_report
 from .fetchers.images import attach_og_images
+from .fetchers.transport import configure_transport
+from .fetchers.articles import ArticleCache, enrich_with_article_text
+from .source_health import SourceHealth, format_status
 
 def send_email(config, subject, html_content):
     import traceback
@@ -25,7 +28,7 @@ def send_email(config, subject, html_content):
 
     recipients = get_recipients()
     if not recipients:
-        print("⚠️ No recipients found in Supabase.")
+        print("⚠️ No recipients found in Supabase snapshot.")
         return
 
     smtp_cfg = email_cfg["smtp"]
@@ -90,16 +93,83 @@ def filter_items(items: List[NewsItem], include_keywords: list[str], exclude_dom
     return filtered
 
 
+def select_items(items: List[NewsItem], config) -> List[NewsItem]:
+    """Apply the config's lookback window, then its keyword and domain filters."""
+    # Time window filter
+    opts = (config.get("options", {}) or {})
+    if int(opts.get("lookback_hours", 0)) > 0:
+        now = datetime.now(timezone.utc)
+        start = now - timedelta(hours=int(opts.get("lookback_hours", 0)))
+        keep_untimed = bool(opts.get("keep_items_without_timestamp", True))
+        items = [it for it in items if (it.published_at and it.published_at >= start) or (keep_untimed and it.published_at is None)]
+
+    return filter_items(items, config.get("filters", {}).get("include_keywords", []), config.get("filters", {}).get("exclude_domains", []))
+
+
+def sort_items(items: List[NewsItem]) -> None:
+    """Newest first, then by score; items without a timestamp go last."""
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    items.sort(key=lambda x: (x.published_at or oldest, x.score), reverse=True)
+
+
+def enrich_articles(items: List[NewsItem], config) -> set[str]:
+    """Attach extracted article text to the items the report will actually use.
+    Returns the URLs whose page was read (see enrich_with_article_text)."""
+    art_cfg = config.get("articles", {}) or {}
+    limit = int(art_cfg.get("max_items") or config.get("options", {}).get("max_items", 30))
+    cache = ArticleCache.from_config(config)
+    read = enrich_with_article_text(
+        select_for_report(items, config)[:limit],
+        cache,
+        max_tokens=int(art_cfg.get("max_tokens_per_item", 400)),
+        max_workers=int(art_cfg.get("max_workers", 8)),
+        timeout=config.get("options", {}).get("fetch_timeout_sec", 15),
+        with_images=bool(config.get("options", {}).get("fetch_images", False)),
+    )
+    cache.save()
+    return read
+
+
 def main():
     parser = argparse.ArgumentParser(description="AINewsAgent CLI")
     parser.add_argument("--once", action="store_true", help="Run one fetch and print a summary")
     parser.add_argument("--report", type=str, default=None, help="Write full LLM report (HTML or Markdown) to the given path")
     parser.add_argument("--config", type=str, default=None, help="Path to config.yaml")
     parser.add_argument("--send-email", action="store_true", help="Send the digest/report via email")
+    # Subcommands accept the same flags after their name; SUPPRESS keeps an
+    # absent flag from overwriting a value given before the subcommand
+    config_parent = argparse.ArgumentParser(add_help=False)
+    config_parent.add_argument("--config", type=str, default=argparse.SUPPRESS, help="Path to config.yaml")
+    subparsers = parser.add_subparsers(dest="command")
+    sources_parser = subparsers.add_parser("sources", parents=[config_parent], help="Inspect configured sources")
+    sources_sub = sources_parser.add_subparsers(dest="sources_command", required=True)
+    sources_sub.add_parser("status", parents=[config_parent], help="Show per-source health, discovered feeds and quarantine state")
+    batch_parser = subparsers.add_parser("batch", help="Run several digests from one shared fetch")
+    batch_parser.add_argument("configs", nargs="+", help="Config files, one per digest")
+    batch_parser.add_argument("--report-dir", type=str, default=None, help="Write each report to <dir>/<config name>.html")
+    batch_parser.add_argument("--send-email", action="store_true", default=argparse.SUPPRESS, help="Send each digest via email")
     args = parser.parse_args()
 
+    if args.command == "batch":
+        if not args.report_dir and not args.send_email:
+            batch_parser.error("nothing to do with the reports: pass --report-dir and/or --send-email")
+        from .batch import run_batch
+        run_batch(args.configs, report_dir=args.report_dir, send=args.send_email)
+        return
+
     config = load_config(args.config)
 
+    if args.command == "sources":
+        health = SourceHealth.from_config(config)
+        print(format_status(health.status_rows(config.get("sources", {}).get("rss_urls", []))))
+        return
+
+    transport = configure_transport(config)
+
+    if args.send_email:
+        # Refresh the recipient snapshot while we fetch and build the report
+        configure_recipient_sync(config).start_background()
+
     # --- Fetching Logic ---
     rss_urls = config.get("sources", {}).get("rss_urls", [])
     reddit_subs = config.get("sources", {}).get("reddit_subreddits", [])
@@ -109,35 +179,35 @@ def main():
 
     items: List[NewsItem] = []
     if rss_urls:
-        items.extend(fetch_from_rss(rss_urls, max_items_per_feed=int(config.get("options", {}).get("rss_max_per_feed", 15))))
+        health = SourceHealth.from_config(config)
+        items.extend(fetch_from_rss(rss_urls, max_items_per_feed=int(config.get("options", {}).get("rss_max_per_feed", 15)), timeout=config.get("options", {}).get("fetch_timeout_sec", 15), health=health))
+        health.save()
     if reddit_subs:
         items.extend(fetch_from_reddit(reddit_subs, limit=int(config.get("options", {}).get("reddit_limit", 15)), timeout=config.get("options", {}).get("fetch_timeout_sec", 15)))
     if twitter_accounts:
-        items.extend(fetch_from_twitter(twitter_accounts, nitter_instances=nitter_instances, max_items_per_account=int(config.get("options", {}).get("twitter_max_per_account", 15))))
+        items.extend(fetch_from_twitter(twitter_accounts, nitter_instances=nitter_instances, max_items_per_account=int(config.get("options", {}).get("twitter_max_per_account", 15)), timeout=config.get("options", {}).get("fetch_timeout_sec", 15)))
     if discord_cfg.get("enabled"):
         token = discord_cfg.get("bot_token") or ""
         channel_ids = discord_cfg.get("channel_ids") or []
         per_limit = int(discord_cfg.get("per_channel_limit") or 50)
         if token and channel_ids:
-            items.extend(fetch_from_discord(token, channel_ids, per_limit=per_limit, timeout=config.get("options", {}).get("fetch_timeout_sec", 15)))
+            items.extend(fetch_from_discord(token, channel_ids, per_channel_limit=per_limit, timeout=config.get("options", {}).get("fetch_timeout_sec", 15)))
         else:
             print("Discord enabled but missing bot_token or channel_ids; skipping.")
 
-    # Time window filter
-    opts = (config.get("options", {}) or {})
-    if int(opts.get("lookback_hours", 0)) > 0:
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=int(opts.get("lookback_hours", 0)))
-        keep_untimed = bool(opts.get("keep_items_without_timestamp", True))
-        items = [it for it in items if (it.published_at and it.published_at >= start) or (keep_untimed and it.published_at is None)]
+    items = select_items(items, config)
 
-    items = filter_items(items, config.get("filters", {}).get("include_keywords", []), config.get("filters", {}).get("exclude_domains", []))
+    pages_read: set[str] = set()
+    if bool(config.get("articles", {}).get("enabled", False)):
+        pages_read = enrich_articles(items, config)
 
     if bool(config.get("options", {}).get("fetch_images", False)):
-        attach_og_images(items, timeout=config.get("options", {}).get("fetch_timeout_sec", 15))
+        # Pages read for article text already supplied their og:image
+        attach_og_images([it for it in items if it.url not in pages_read], timeout=config.get("options", {}).get("fetch_timeout_sec", 15))
+
+    print(transport.summary())
 
-    # Sort
-    items.sort(key=lambda x: (x.published_at or 0, x.score), reverse=True)
+    sort_items(items)
 
     full_report = None
 
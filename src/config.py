@@ -56,6 +56,20 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     data["options"].setdefault("fetch_images", True)
     data["options"].setdefault("fetch_timeout_sec", 15)
 
+    # Shared HTTP transport used by every fetcher
+    data.setdefault("http", {})
+    data["http"].setdefault("pool_maxsize", 16)
+    data["http"].setdefault("http2", False)
+    data["http"].setdefault("user_agent", "")
+
+    # Source health tracking and quarantine of failing feeds
+    data.setdefault("health", {})
+    data["health"].setdefault("state_path", ".ainews/source_health.json")
+    data["health"].setdefault("failure_threshold", 3)
+    # Back-off is counted in runs, so it does not depend on the cron schedule
+    data["health"].setdefault("base_skip_runs", 1)
+    data["health"].setdefault("max_skip_runs", 32)
+
     # Additional controls to limit search space without losing sources
     data["options"].setdefault("lookback_hours", 0)
     data["options"].setdefault("keep_items_without_timestamp", True)
@@ -63,6 +77,30 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     data["options"].setdefault("reddit_limit", 15)
     data["options"].setdefault("twitter_max_per_account", 15)
 
+    # Local extractive report engine (llm.provider: "extractive", or fallback)
+    data.setdefault("extractive", {})
+    data["extractive"].setdefault("max_sections", 10)
+    data["extractive"].setdefault("similarity_threshold", 0.3)
+    data["extractive"].setdefault("sentences_per_section", 4)
+    data["extractive"].setdefault("max_bullets", 4)
+    data["extractive"].setdefault("max_summary_chars", 2000)
+
+    # Optional full-article text extraction after filtering
+    data.setdefault("articles", {})
+    data["articles"].setdefault("enabled", False)
+    data["articles"].setdefault("max_items", 0)  # 0 -> options.max_items
+    data["articles"].setdefault("max_tokens_per_item", 400)
+    data["articles"].setdefault("max_workers", 8)
+    data["articles"].setdefault("cache_path", ".ainews/articles.json")
+    data["articles"].setdefault("ttl_days", 14)
+
+    # Local snapshot of the Supabase recipients table
+    data.setdefault("recipients", {})
+    data["recipients"].setdefault("snapshot_path", ".ainews/recipients.json")
+    data["recipients"].setdefault("page_size", 500)
+    data["recipients"].setdefault("cursor_column", "updated_at")
+    data["recipients"].setdefault("full_sync_hours", 24)
+
     # Ranking defaults
     data.setdefault("ranking", {})
     data["ranking"].setdefault("source_weights", {
@@ -2,10 +2,9 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 import os
-import html
 
 from .news_types import NewsItem
-from google import genai
+from .extractive import make_extractive_report
 
 
 def _normalize_url(url: str | None) -> str:
@@ -76,8 +75,9 @@ def _make_llm_prompt_full_report(items: List[NewsItem], max_items: int = 40) ->
         published = it.published_at.isoformat() if it.published_at else ""
         image_part = f" image_url={it.image_url}" if getattr(it, "image_url", None) else ""
         summary_part = (it.summary or "").replace("\n", " ").strip()
+        article_part = f" article={' '.join(it.content.split())}" if getattr(it, "content", None) else ""
         lines.append(
-            f"- [source={it.source}] title={it.title} date={published} url={it.url}{image_part} summary={summary_part}"
+            f"- [source={it.source}] title={it.title} date={published} url={it.url}{image_part} summary={summary_part}{article_part}"
         )
     return "\n".join(lines)
 
@@ -104,6 +104,7 @@ def _call_gemini(cfg: Dict[str, Any], prompt: str, max_retries: int = 3, delay_s
             if base_url:
                 client_args["base_url"] = base_url
 
+            from google import genai
             client = genai.Client(**client_args)
 
             print("⚡ Sending request to Gemini…")
@@ -144,27 +145,22 @@ def _call_gemini(cfg: Dict[str, Any], prompt: str, max_retries: int = 3, delay_s
 
     return None
 
-def _escape(s: str | None) -> str:
-    return html.escape(s or "")
-
-
-def _fallback_sections(items: List[NewsItem], max_items: int = 30) -> str:
-    parts: list[str] = []
-    for it in items[:max_items]:
-        published = it.published_at.isoformat() if it.published_at else ""
-        parts.append(
-            f"<li>[{_escape(it.source)}] <a href=\"{_escape(it.url)}\">{_escape(it.title)}</a> <small>{_escape(published)}</small></li>"
-        )
-    return "<h2>Latest</h2><ul>" + "\n".join(parts) + "</ul>"
+def select_for_report(items: List[NewsItem], config: Dict[str, Any]) -> List[NewsItem]:
+    """Deduplicate and rank items the way the report sees them."""
+    weights = (config.get("ranking", {}) or {}).get("source_weights", {})
+    return rank_items(dedupe_items(items), weights=weights)
 
 
 def make_report(items: List[NewsItem], config: Dict[str, Any]) -> str:
-    """Return the raw LLM-generated full report (HTML or Markdown). Falls back to a simple HTML list."""
-    items = dedupe_items(items)
-    weights = (config.get("ranking", {}) or {}).get("source_weights", {})
-    items = rank_items(items, weights=weights)
+    """Return the raw LLM-generated full report (HTML or Markdown).
+
+    With llm.provider set to "extractive" the report is built locally; the same
+    engine is used as the fallback when the LLM is disabled or fails.
+    """
+    items = select_for_report(items, config)
     llm_cfg = (config.get("llm") or {})
-    use_llm = bool(llm_cfg.get("enabled"))
+    provider = (llm_cfg.get("provider") or "gemini").strip().lower()
+    use_llm = bool(llm_cfg.get("enabled")) and provider != "extractive"
     if use_llm:
         print("⚡ Calling Gemini with", len(items), "items...")
         prompt = _make_llm_prompt_full_report(items, max_items=int(config.get("options", {}).get("max_items", 40)))
@@ -172,5 +168,6 @@ def make_report(items: List[NewsItem], config: Dict[str, Any]) -> str:
         print("⚡ Gemini returned:", "yes" if text else "no")
         if text:
             return text
-    # Fallback: return a minimal HTML snippet
-    return _fallback_sections(items)
\ No newline at end of file
+    # Fallback: local extractive report
+    print("⚡ Building extractive report with", len(items), "items...")
+    return make_extractive_report(items, config)
@@ -1,16 +1,179 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import json
 import os
-from supabase import create_client, Client
+import threading
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 # Use the SERVICE_ROLE key here for server-side access
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")  # <-- new
 
-# Create client with service role key (bypasses RLS)
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+_ROOT = os.path.dirname(os.path.dirname(__file__))
+_client: Optional["Client"] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> "Client":
+    """Create the Supabase client on first use (service role key, bypasses RLS)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            from supabase import create_client
+            _client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+        return _client
+
+
+def _is_missing_column(exc: Exception, column: Optional[str]) -> bool:
+    """True when PostgREST rejected the query because `column` is not in the table."""
+    if not column:
+        return False
+    # 42703 is Postgres' undefined_column
+    return getattr(exc, "code", None) == "42703" or (column in str(exc) and "does not exist" in str(exc))
+
+
+class RecipientSync:
+    """Local snapshot of the recipients table, refreshed incrementally.
+
+    Each sync pages through rows whose cursor column (updated_at) is newer than
+    the last one seen, so unsubscribes arrive as active=false updates. A full
+    re-read every `full_sync_hours` catches hard deletes. Without that column
+    every sync is a full paged read. Sends are served from the snapshot, so a
+    Supabase outage falls back to the last good copy, provided the snapshot
+    file survives between runs (it is not cached in GitHub Actions).
+    """
+
+    def __init__(self, snapshot_path: str, page_size: int = 500, cursor_column: Optional[str] = "updated_at", full_sync_hours: float = 24):
+        self.snapshot_path = snapshot_path
+        self.page_size = max(1, int(page_size))
+        self.cursor_column = cursor_column or None
+        self.full_sync_hours = float(full_sync_hours)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot: Dict[str, Any] = self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RecipientSync":
+        cfg = config.get("recipients", {}) or {}
+        path = cfg.get("snapshot_path") or ".ainews/recipients.json"
+        if not os.path.isabs(path):
+            path = os.path.join(_ROOT, path)
+        return cls(
+            path,
+            page_size=cfg.get("page_size", 500),
+            cursor_column=cfg.get("cursor_column", "updated_at"),
+            full_sync_hours=cfg.get("full_sync_hours", 24),
+        )
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.isfile(self.snapshot_path):
+            return {}
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                return json.load(f) or {}
+        except Exception as e:
+            print(f"⚠️ Could not read recipient snapshot {self.snapshot_path}: {e}")
+            return {}
+
+    def _save(self, snapshot: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+        tmp = self.snapshot_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.snapshot_path)
+
+    def _needs_full_sync(self, now: datetime) -> bool:
+        last_full = self._snapshot.get("last_full_sync")
+        if not self.cursor_column or not last_full or not self._snapshot.get("rows"):
+            return True
+        return now - datetime.fromisoformat(last_full) >= timedelta(hours=self.full_sync_hours)
+
+    def _fetch_pages(self, cursor: Optional[str]) -> List[dict]:
+        columns = "email,active" + (f",{self.cursor_column}" if self.cursor_column else "")
+        rows: List[dict] = []
+        start = 0
+        while True:
+            query = get_client().table("recipients").select(columns)
+            if cursor:
+                query = query.gt(self.cursor_column, cursor)
+            if self.cursor_column:
+                query = query.order(self.cursor_column)
+            query = query.order("email").range(start, start + self.page_size - 1)
+            page = query.execute().data or []
+            rows.extend(page)
+            if len(page) < self.page_size:
+                return rows
+            start += self.page_size
+
+    def sync(self) -> bool:
+        """Pull changes from Supabase into the snapshot. Returns False on failure."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            full = self._needs_full_sync(now)
+            cursor = None if full else self._snapshot.get("cursor")
+            known = {} if full else dict(self._snapshot.get("rows") or {})
+        try:
+            changed = self._fetch_pages(cursor)
+        except Exception as e:
+            if _is_missing_column(e, self.cursor_column):
+                print(f"⚠️ recipients.{self.cursor_column} does not exist; syncing with full paged reads instead.")
+                self.cursor_column = None
+                return self.sync()
+            print(f"⚠️ Recipient sync failed ({type(e).__name__}: {e}); using last snapshot.")
+            return False
+
+        for row in changed:
+            email = (row.get("email") or "").strip()
+            if email:
+                known[email] = bool(row.get("active"))
+        # Pages are ordered by the cursor column, so the last row holds the newest value
+        if self.cursor_column and changed and changed[-1].get(self.cursor_column):
+            cursor = changed[-1][self.cursor_column]
+        snapshot = {
+            "rows": known,
+            "cursor": cursor,
+            "last_sync": now.isoformat(),
+            "last_full_sync": now.isoformat() if full else self._snapshot.get("last_full_sync"),
+        }
+        with self._lock:
+            self._snapshot = snapshot
+            self._save(snapshot)
+        print(f"✅ Recipient sync ({'full' if full else 'incremental'}): {len(changed)} rows changed, {sum(known.values())} active")
+        return True
+
+    def start_background(self) -> threading.Thread:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self.sync, name="recipient-sync", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def recipients(self, wait_sec: float = 30) -> List[str]:
+        """Active emails from the snapshot. Waits for an in-flight refresh, and
+        waits without limit when there is no snapshot to fall back to."""
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(None if not self._snapshot.get("rows") else wait_sec)
+        elif not self._snapshot.get("last_sync"):
+            self.sync()
+        with self._lock:
+            rows = self._snapshot.get("rows") or {}
+            return sorted(email for email, active in rows.items() if active)
+
+
+_sync: Optional[RecipientSync] = None
+
+
+def configure_recipient_sync(config: Dict[str, Any]) -> RecipientSync:
+    global _sync
+    _sync = RecipientSync.from_config(config)
+    return _sync
+
 
 def get_recipients():
-    """Fetching all active email addresses from Supabase, bypassing RLS."""
-    data = supabase.table("recipients").select("email").eq("active", True).execute()
-    if data.data:
-        return [r["email"] for r in data.data]
-    return []
+    """Fetching all active email addresses from the local Supabase snapshot, bypassing RLS."""
+    global _sync
+    if _sync is None:
+        _sync = RecipientSync.from_config({})
+    return _sync.recipients()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+from collections import Counter
+from datetime import datetime
+from typing import List, Dict, Any
+import html
+import math
+import re
+
+from .news_types import NewsItem
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#\-]*[a-z0-9+#]|[a-z0-9]")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+
+_STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here hers him
+his how i if in into is it its itself just me more most my new no nor not now of off on once only or other our ours
+out over own same she should so some such than that the their theirs them then there these they this those through
+to too under until up very was we were what when where which while who whom why will with would you your yours
+via says said read more post appeared first continue reading today week year
+""".split())
+
+_REPORT_STYLE = """
+body { font-family: system-ui, -apple-system, "Segoe UI", sans-serif; background: #f9f9f9; color: #333; margin: 0; padding: 24px; line-height: 1.55; }
+.section { background: #fff; border-radius: 8px; box-shadow: 0 1px 4px rgba(0,0,0,0.08); padding: 20px 24px; margin: 0 auto 20px; max-width: 760px; }
+h1 { margin-top: 0; }
+h2 { margin-top: 0; font-size: 1.25em; }
+img { max-width: 100%; border-radius: 6px; margin: 8px 0; }
+small { color: #777; }
+"""
+
+
+def _clean_text(text: str | None) -> str:
+    text = html.unescape(_TAG_RE.sub(" ", text or ""))
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS and not t.isdigit()]
+
+
+def _tfidf(counts: Counter, idf: Dict[str, float]) -> Dict[str, float]:
+    vec = {t: (1.0 + math.log(c)) * idf.get(t, 0.0) for t, c in counts.items()}
+    norm = math.sqrt(sum(w * w for w in vec.values()))
+    if not norm:
+        return {}
+    return {t: w / norm for t, w in vec.items()}
+
+
+def _dot(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+def _vectorize(items: List[NewsItem], max_summary_chars: int) -> tuple[List[Dict[str, float]], Dict[str, float], List[str]]:
+    """Sparse TF-IDF over title + summary. The title is counted twice so that
+    short headlines dominate noisy feed teasers."""
+    texts: List[str] = []
+    doc_counts: List[Counter] = []
+    df: Counter = Counter()
+    for it in items:
+        summary = _clean_text(it.content or it.summary)[:max_summary_chars]
+        texts.append(summary)
+        title_tokens = _tokenize(it.title or "")
+        counts = Counter(title_tokens * 2 + _tokenize(summary))
+        doc_counts.append(counts)
+        df.update(counts.keys())
+    n = len(items)
+    idf = {t: math.log((1.0 + n) / (1.0 + d)) + 1.0 for t, d in df.items()}
+    return [_tfidf(c, idf) for c in doc_counts], idf, texts
+
+
+def _top_terms(vec: Dict[str, float], k: int) -> List[str]:
+    return sorted(vec, key=vec.__getitem__, reverse=True)[:k]
+
+
+def _cluster(vectors: List[Dict[str, float]], threshold: float, top_k: int = 8, max_postings: int = 32, recent: int = 8) -> List[List[int]]:
+    """Single-pass leader clustering. Items arrive in rank order, so each
+    cluster is led by its best-ranked item.
+
+    Candidate leaders come from an inverted index that only holds each
+    leader's `top_k` heaviest terms and keeps the `max_postings` most recent
+    leaders per term, which bounds the work per item to top_k * max_postings
+    postings. The few best candidates, plus the `recent` newest leaders, are
+    then scored exactly.
+    """
+    clusters: List[List[int]] = []
+    leaders: List[Dict[str, float]] = []
+    postings: Dict[str, List[int]] = {}
+    for idx, vec in enumerate(vectors):
+        terms = _top_terms(vec, top_k)
+        partial: Dict[int, float] = {}
+        for t in terms:
+            w = vec[t]
+            for cid in postings.get(t, ()):
+                partial[cid] = partial.get(cid, 0.0) + w * leaders[cid][t]
+        candidates = set(sorted(partial, key=partial.__getitem__, reverse=True)[:3])
+        candidates.update(range(max(0, len(leaders) - recent), len(leaders)))
+        best_cid, best_score = -1, 0.0
+        for cid in candidates:
+            score = _dot(vec, leaders[cid])
+            if score > best_score:
+                best_cid, best_score = cid, score
+        if best_cid >= 0 and best_score >= threshold:
+            clusters[best_cid].append(idx)
+            continue
+        cid = len(clusters)
+        clusters.append([idx])
+        leaders.append(vec)
+        for t in terms:
+            posting = postings.setdefault(t, [])
+            posting.append(cid)
+            if len(posting) > max_postings:
+                del posting[0]
+    return clusters
+
+
+def _centroid(members: List[int], vectors: List[Dict[str, float]]) -> Dict[str, float]:
+    centroid: Dict[str, float] = {}
+    for i in members:
+        for t, w in vectors[i].items():
+            centroid[t] = centroid.get(t, 0.0) + w
+    return centroid
+
+
+def _key_sentences(members: List[int], items: List[NewsItem], texts: List[str], centroid: Dict[str, float], idf: Dict[str, float], limit: int) -> List[str]:
+    candidates: List[tuple[float, int, str]] = []
+    seen: set[str] = set()
+    order = 0
+    for i in members:
+        for sent in _SENTENCE_RE.split(texts[i]):
+            sent = sent.strip()
+            key = sent.lower()
+            if len(sent) < 40 or len(sent) > 400 or key in seen:
+                continue
+            seen.add(key)
+            score = _dot(_tfidf(Counter(_tokenize(sent)), idf), centroid)
+            candidates.append((score, order, sent))
+            order += 1
+    if not candidates:
+        return [_clean_text(items[i].title) for i in members[:limit]]
+    top = sorted(candidates, key=lambda c: c[0], reverse=True)[:limit]
+    # Keep the chosen sentences in their original reading order
+    return [s for _, _, s in sorted(top, key=lambda c: c[1])]
+
+
+def _escape(s: str | None) -> str:
+    return html.escape(s or "")
+
+
+def _render_section(members: List[int], items: List[NewsItem], sentences: List[str], max_bullets: int) -> str:
+    lead = items[members[0]]
+    parts = [f"<div class=\"section\"><h2>{_escape(_clean_text(lead.title))}</h2>"]
+    image = next((items[i].image_url for i in members if items[i].image_url), None)
+    if image:
+        parts.append(f"<img src=\"{_escape(image)}\" alt=\"{_escape(_clean_text(lead.title))}\">")
+    if sentences:
+        parts.append(f"<p>{_escape(' '.join(sentences))}</p>")
+    bullets: List[str] = []
+    for i in members[:max_bullets]:
+        it = items[i]
+        published = it.published_at.strftime("%Y-%m-%d %H:%M") if it.published_at else ""
+        bullets.append(
+            f"<li>[{_escape(it.source)}] <a href=\"{_escape(it.url)}\">{_escape(_clean_text(it.title))}</a> <small>{_escape(published)}</small></li>"
+        )
+    parts.append("<ul>" + "\n".join(bullets) + "</ul>")
+    if lead.url:
+        parts.append(f"<p><a href=\"{_escape(lead.url)}\">Read more</a></p>")
+    parts.append("</div>")
+    return "\n".join(parts)
+
+
+def make_extractive_report(items: List[NewsItem], config: Dict[str, Any]) -> str:
+    """Build the sectioned HTML report locally, without an LLM.
+
+    Expects items already deduplicated and ranked (best first). Items are
+    clustered into topics by TF-IDF cosine similarity and each topic is
+    summarised with its most central sentences.
+    """
+    opts = (config.get("extractive") or {})
+    threshold = float(opts.get("similarity_threshold", 0.3))
+    max_sections = int(opts.get("max_sections", 10))
+    sentences_per_section = int(opts.get("sentences_per_section", 4))
+    max_bullets = int(opts.get("max_bullets", 4))
+    max_summary_chars = int(opts.get("max_summary_chars", 2000))
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    head = (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>AI Daily Report - {today}</title>\n<style>{_REPORT_STYLE}</style>\n</head>\n<body>\n"
+    )
+    if not items:
+        return head + "<div class=\"section\"><h1>AI Daily Report</h1><p>No new items in this window.</p></div>\n</body>\n</html>"
+
+    vectors, idf, texts = _vectorize(items, max_summary_chars)
+    clusters = _cluster(vectors, threshold)
+    # Topics covered by many well-ranked items come first
+    clusters.sort(key=lambda members: sum(1.0 / (1.0 + i) ** 0.5 for i in members), reverse=True)
+    clusters = clusters[:max_sections]
+
+    sections: List[str] = []
+    highlights: List[str] = []
+    for members in clusters:
+        centroid = _centroid(members, vectors)
+        sentences = _key_sentences(members, items, texts, centroid, idf, sentences_per_section)
+        sections.append(_render_section(members, items, sentences, max_bullets))
+        if sentences:
+            highlights.append(sentences[0])
+
+    takeaways = "".join(
+        f"<li><a href=\"{_escape(items[m[0]].url)}\">{_escape(_clean_text(items[m[0]].title))}</a>"
+        f" <small>({len(m)} source{'s' if len(m) != 1 else ''})</small></li>"
+        for m in clusters
+    )
+    summary = " ".join(highlights[:5])
+    return (
+        head
+        + "<div class=\"section\"><h1>AI Daily Report</h1>"
+        + f"<h2>Executive Summary</h2><p>{_escape(summary)}</p>"
+        + f"<p><small>{len(items)} items grouped into {len(clusters)} topics.</small></p></div>\n"
+        + "\n".join(sections)
+        + f"\n<div class=\"section\"><h2>Key Takeaways</h2><ul>{takeaways}</ul></div>\n</body>\n</html>"
+    )
@@ -0,0 +1,196 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+import hashlib
+import json
+import os
+import threading
+
+from bs4 import BeautifulSoup
+
+from ..news_types import NewsItem
+from .images import _extract_og_image
+from .transport import get_transport
+
+try:
+    import trafilatura
+except ImportError:  # optional, better extraction when installed
+    trafilatura = None
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+_BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure", "iframe", "svg", "button"]
+# Rough conversion used for the per-item budget; good enough for English prose
+CHARS_PER_TOKEN = 4
+MAX_CACHED_CHARS = 20000
+
+
+def extract_main_text(html_text: str | bytes) -> str:
+    """Return the article body of a page with navigation and other boilerplate removed.
+    Pass the raw bytes when the Content-Type header may lack a charset, so the
+    page's own <meta charset> is honoured."""
+    if trafilatura is not None:
+        text = trafilatura.extract(html_text, include_comments=False, include_tables=False)
+        if text:
+            return text.strip()
+
+    soup = BeautifulSoup(html_text, "html.parser")
+    for tag in soup(_BOILERPLATE_TAGS):
+        tag.decompose()
+    root = soup.find("article") or soup.find("main") or soup.body or soup
+
+    # The element holding the most paragraph text is almost always the article body
+    weights: Dict[int, int] = {}
+    parents: Dict[int, Any] = {}
+    for p in root.find_all("p"):
+        length = len(p.get_text(" ", strip=True))
+        if length < 40:
+            continue
+        parents[id(p.parent)] = p.parent
+        weights[id(p.parent)] = weights.get(id(p.parent), 0) + length
+    if not weights:
+        return " ".join(root.get_text(" ", strip=True).split())
+    container = parents[max(weights, key=weights.get)]
+    paragraphs = [p.get_text(" ", strip=True) for p in container.find_all("p")]
+    return "\n".join(" ".join(t.split()) for t in paragraphs if len(t) >= 40)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    limit = max(0, int(max_tokens)) * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    space = cut.rfind(" ")
+    return (cut[:space] if space > limit // 2 else cut).rstrip() + "…"
+
+
+class ArticleCache:
+    """Extracted article text keyed by URL and by a hash of the page body.
+
+    A URL seen within `ttl_days` is not fetched again; a different URL serving
+    the same page (syndication, tracking parameters) is fetched but not
+    re-extracted.
+    """
+
+    def __init__(self, path: str, ttl_days: float = 14):
+        self.path = path
+        self.ttl = timedelta(days=float(ttl_days))
+        self._lock = threading.Lock()
+        self.urls: Dict[str, Dict[str, str]] = {}
+        self.texts: Dict[str, Dict[str, str]] = {}
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ArticleCache":
+        cfg = config.get("articles", {}) or {}
+        path = cfg.get("cache_path") or ".ainews/articles.json"
+        if not os.path.isabs(path):
+            path = os.path.join(_ROOT, path)
+        return cls(path, ttl_days=cfg.get("ttl_days", 14))
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f) or {}
+            self.urls = raw.get("urls", {})
+            self.texts = raw.get("texts", {})
+        except Exception as e:
+            print(f"⚠️ Could not read article cache {self.path}: {e}")
+
+    def save(self) -> None:
+        cutoff = (datetime.now(timezone.utc) - self.ttl).isoformat()
+        with self._lock:
+            self.urls = {u: v for u, v in self.urls.items() if v.get("seen", "") >= cutoff}
+            self.texts = {h: v for h, v in self.texts.items() if v.get("seen", "") >= cutoff}
+            state = {"urls": self.urls, "texts": self.texts}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    def get_by_url(self, url: str) -> Optional[Dict[str, str]]:
+        """The cached {"text", "image"} entry for url, if any."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            entry = self.urls.get(url)
+            page = self.texts.get(entry["hash"]) if entry else None
+            if page is None:
+                return None
+            entry["seen"] = page["seen"] = now
+            return page
+
+    def get_by_hash(self, url: str, digest: str) -> Optional[Dict[str, str]]:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            page = self.texts.get(digest)
+            if page is None:
+                return None
+            self.urls[url] = {"hash": digest, "seen": now}
+            page["seen"] = now
+            return page
+
+    def put(self, url: str, digest: str, text: str, image: Optional[str]) -> Dict[str, str]:
+        now = datetime.now(timezone.utc).isoformat()
+        page = {"text": text[:MAX_CACHED_CHARS], "image": image, "seen": now}
+        with self._lock:
+            self.urls[url] = {"hash": digest, "seen": now}
+            self.texts[digest] = page
+        return page
+
+
+def _fetch_article(url: str, cache: ArticleCache, timeout: float | None) -> tuple[Optional[Dict[str, str]], str]:
+    page = cache.get_by_url(url)
+    if page is not None:
+        return page, "cached"
+    resp = get_transport().get(url, timeout=timeout)
+    if resp.status_code != 200 or "html" not in resp.headers.get("content-type", "html").lower():
+        return None, "skipped"
+    digest = hashlib.sha256(resp.content).hexdigest()
+    page = cache.get_by_hash(url, digest)
+    if page is not None:
+        return page, "cached"
+    # Raw bytes, not resp.text: requests decodes text/html without a charset
+    # header as ISO-8859-1, while the parsers read the in-page charset.
+    # Keep the og:image too, so the image step does not download the page again
+    return cache.put(url, digest, extract_main_text(resp.content), _extract_og_image(resp.content)), "extracted"
+
+
+def enrich_with_article_text(items: Iterable[NewsItem], cache: ArticleCache, max_tokens: int = 400, max_workers: int = 8, timeout: float | None = None, with_images: bool = False) -> Set[str]:
+    """Mutates items in-place, setting content to the truncated article text
+    and, with with_images, image_url from the page's OpenGraph tags.
+    Each distinct URL is fetched at most once, concurrently. Returns the URLs
+    whose page was read, so the image step can skip them.
+    """
+    by_url: Dict[str, List[NewsItem]] = {}
+    for it in items:
+        if it.url and not it.content:
+            by_url.setdefault(it.url, []).append(it)
+    if not by_url:
+        return set()
+
+    def run(url: str) -> tuple[Optional[Dict[str, str]], str]:
+        try:
+            return _fetch_article(url, cache, timeout)
+        except Exception:
+            return None, "failed"
+
+    counts: Dict[str, int] = {}
+    read: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+        for url, (page, outcome) in zip(by_url, pool.map(run, by_url)):
+            counts[outcome] = counts.get(outcome, 0) + 1
+            if page is None:
+                continue
+            # Entries cached before images were stored have no "image" key
+            if "image" in page:
+                read.add(url)
+            for it in by_url[url]:
+                if page.get("text"):
+                    it.content = truncate_to_tokens(page["text"], max_tokens)
+                if with_images and page.get("image") and not it.image_url:
+                    it.image_url = page["image"]
+    print("[Articles] " + ", ".join(f"{k}: {v}" for k, v in sorted(counts.items())))
+    return read
@@ -1,22 +1,18 @@
 from datetime import datetime, timezone
 from typing import Iterable, List, Optional
-import requests
 from ..news_types import NewsItem
+from .transport import Transport, get_transport
 
 API_BASE = "https://discord.com/api/v10"
-USER_AGENT = "AINewsAgent/0.1 (discord-fetcher)"
 
 
 def _auth_headers(bot_token: str) -> dict:
-    return {
-        "Authorization": f"Bot {bot_token}",
-        "User-Agent": USER_AGENT,
-    }
+    return {"Authorization": f"Bot {bot_token}"}
 
 
-def _get_channel_info(session: requests.Session, channel_id: str) -> Optional[dict]:
+def _get_channel_info(transport: Transport, headers: dict, channel_id: str, timeout: int) -> Optional[dict]:
     try:
-        r = session.get(f"{API_BASE}/channels/{channel_id}")
+        r = transport.get(f"{API_BASE}/channels/{channel_id}", headers=headers, timeout=timeout)
         if r.status_code == 200:
             return r.json()
         return None
@@ -24,9 +20,9 @@ def _get_channel_info(session: requests.Session, channel_id: str) -> Optional[di
         return None
 
 
-def _get_recent_messages(session: requests.Session, channel_id: str, limit: int) -> list[dict]:
+def _get_recent_messages(transport: Transport, headers: dict, channel_id: str, limit: int, timeout: int) -> list[dict]:
     try:
-        r = session.get(f"{API_BASE}/channels/{channel_id}/messages", params={"limit": limit})
+        r = transport.get(f"{API_BASE}/channels/{channel_id}/messages", params={"limit": limit}, headers=headers, timeout=timeout)
         if r.status_code == 200:
             return r.json()
         return []
@@ -37,19 +33,18 @@ def _get_recent_messages(session: requests.Session, channel_id: str, limit: int)
 def fetch_from_discord(bot_token: str, channel_ids: Iterable[str], per_channel_limit: int = 50, timeout: int = 15) -> List[NewsItem]:
     if not bot_token or not channel_ids:
         return []
-    session = requests.Session()
-    session.headers.update(_auth_headers(bot_token))
-    session.timeout = timeout
+    transport = get_transport()
+    headers = _auth_headers(bot_token)
 
     items: List[NewsItem] = []
 
     for channel_id in channel_ids:
-        channel_info = _get_channel_info(session, channel_id)
+        channel_info = _get_channel_info(transport, headers, channel_id, timeout)
         channel_name = channel_info.get("name") if isinstance(channel_info, dict) else None
         guild_id = channel_info.get("guild_id") if isinstance(channel_info, dict) else None
         source_name = f"Discord #{channel_name}" if channel_name else "Discord"
 
-        messages = _get_recent_messages(session, channel_id, per_channel_limit)
+        messages = _get_recent_messages(transport, headers, channel_id, per_channel_limit, timeout)
         for msg in messages:
             content: str = msg.get("content") or ""
             if not content.strip():
@@ -1,12 +1,12 @@
 from __future__ import annotations
 from typing import Iterable
-import requests
 from bs4 import BeautifulSoup
 
 from ..news_types import NewsItem
+from .transport import get_transport
 
 
-def _extract_og_image(html_text: str) -> str | None:
+def _extract_og_image(html_text: str | bytes) -> str | None:
 	soup = BeautifulSoup(html_text, "html.parser")
 	# Common meta tags for preview images
 	for attr, value in (
@@ -27,16 +27,15 @@ def attach_og_images(items: Iterable[NewsItem], timeout: int = 10) -> None:
 	"""Mutates items in-place, setting image_url where available via OpenGraph.
 	Skips items without a URL or already having an image_url.
 	"""
-	session = requests.Session()
-	headers = {"User-Agent": "AINewsAgent/0.1 (+https://example.com)"}
+	transport = get_transport()
 	for it in items:
 		if not it.url or it.image_url:
 			continue
 		try:
-			resp = session.get(it.url, headers=headers, timeout=timeout)
+			resp = transport.get(it.url, timeout=timeout)
 			if resp.status_code != 200 or not resp.text:
 				continue
-			img = _extract_og_image(resp.text)
+			img = _extract_og_image(resp.content)
 			if img:
 				it.image_url = img
 		except Exception:
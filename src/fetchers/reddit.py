@@ -1,21 +1,18 @@
 from typing import Iterable, List
 from datetime import datetime, timezone
-import requests
 from ..news_types import NewsItem
-
-USER_AGENT = "AINewsAgent/0.1 (contact: you@example.com)"
+from .transport import get_transport
 
 
 def fetch_from_reddit(subreddits: Iterable[str], limit: int = 15, timeout: int = 15) -> List[NewsItem]:
     items: List[NewsItem] = []
-    session = requests.Session()
-    session.headers.update({"User-Agent": USER_AGENT})
+    transport = get_transport()
     for sub in subreddits:
         # Enforce hard cap per subreddit
         per_limit = max(0, min(int(limit or 0), 15))
         url = f"https://www.reddit.com/r/{sub}/new.json?limit={per_limit}"
         try:
-            resp = session.get(url, timeout=timeout)
+            resp = transport.get(url, timeout=timeout)
             if resp.status_code != 200:
                 continue
             data = resp.json()
@@ -1,8 +1,21 @@
-from typing import Iterable, List
+from __future__ import annotations
+from typing import Iterable, List, Optional, TYPE_CHECKING
 from datetime import datetime, timezone
+from urllib.parse import urljoin
+import time
 import feedparser
+from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 from ..news_types import NewsItem
+from .. import source_health
+from .transport import get_transport
+
+if TYPE_CHECKING:
+    from ..source_health import SourceHealth
+
+# In order of preference. Plain application/json is left out on purpose:
+# WordPress advertises its wp-json REST API with that type.
+FEED_TYPES = ("application/rss+xml", "application/atom+xml", "application/feed+json")
 
 
 def parse_datetime(value) -> datetime | None:
@@ -21,15 +34,103 @@ def parse_datetime(value) -> datetime | None:
         return None
 
 
-def fetch_from_rss(urls: Iterable[str], max_items_per_feed: int = 15) -> List[NewsItem]:
+def _download(url: str, timeout: float | None = None):
+    resp = get_transport().get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp
+
+
+def _parse(resp) -> feedparser.FeedParserDict:
+    return feedparser.parse(resp.content, response_headers={
+        "content-location": str(resp.url),
+        "content-type": resp.headers.get("content-type", ""),
+    })
+
+
+def fetch_feed(url: str, timeout: float | None = None) -> feedparser.FeedParserDict:
+    """Download a feed through the shared transport and parse it."""
+    return _parse(_download(url, timeout=timeout))
+
+
+def discover_feed_url(html_text: str, base_url: str) -> str | None:
+    """Return the <link rel="alternate"> feed advertised by an HTML page,
+    preferring RSS over Atom over JSON Feed."""
+    soup = BeautifulSoup(html_text, "html.parser")
+    best: tuple[int, str] | None = None
+    for link in soup.find_all("link", href=True):
+        rel = [r.lower() for r in (link.get("rel") or [])]
+        ftype = (link.get("type") or "").split(";")[0].strip().lower()
+        if "alternate" in rel and ftype in FEED_TYPES:
+            rank = FEED_TYPES.index(ftype)
+            if best is None or rank < best[0]:
+                best = (rank, link["href"].strip())
+    return urljoin(base_url, best[1]) if best else None
+
+
+def _looks_like_html(resp) -> bool:
+    ctype = resp.headers.get("content-type", "").lower()
+    return "html" in ctype or resp.content[:512].lstrip().lower().startswith((b"<!doctype html", b"<html"))
+
+
+def _http_status(exc: Exception) -> Optional[int]:
+    return getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def _load_feed(url: str, timeout: float | None) -> tuple[feedparser.FeedParserDict, str | None]:
+    """Fetch url; if it is an HTML page rather than a feed, follow its advertised feed.
+    Returns the parsed feed and the discovered feed URL, if any."""
+    resp = _download(url, timeout=timeout)
+    feed = _parse(resp)
+    if not feed.entries and _looks_like_html(resp):
+        alt = discover_feed_url(resp.text, str(resp.url))
+        if alt and alt.rstrip("/") != url.rstrip("/"):
+            return fetch_feed(alt, timeout=timeout), alt
+    return feed, None
+
+
+def fetch_from_rss(urls: Iterable[str], max_items_per_feed: int = 15, timeout: float | None = None, health: Optional[SourceHealth] = None) -> List[NewsItem]:
     items: List[NewsItem] = []
+    skipped = 0
     for url in urls:
+        if health and health.is_quarantined(url):
+            health.skip(url)
+            skipped += 1
+            continue
+        target = health.feed_url(url) if health else url
+        start = time.perf_counter()
+        try:
+            feed, discovered = _load_feed(target, timeout)
+        except Exception as e:
+            status = _http_status(e)
+            if health:
+                health.record(
+                    url,
+                    source_health.HTTP_ERROR if status else source_health.NETWORK_ERROR,
+                    latency_ms=(time.perf_counter() - start) * 1000,
+                    http_status=status,
+                    error=f"{type(e).__name__}: {e}",
+                )
+            print(f"[RSS] Failed to fetch {url}: {type(e).__name__}")
+            continue
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        entries = getattr(feed, "entries", [])
+        if health:
+            if entries:
+                outcome, error = source_health.OK, None
+            elif feed.get("bozo"):
+                outcome, error = source_health.PARSE_ERROR, str(feed.get("bozo_exception") or "not a feed")
+            else:
+                outcome, error = source_health.EMPTY, None
+            health.record(url, outcome, latency_ms=latency_ms, entries=len(entries), error=error, discovered_feed=discovered)
+        if discovered:
+            print(f"[RSS] Discovered feed {discovered} for {url}")
+
         try:
-            feed = feedparser.parse(url)
             source_title = feed.feed.get("title", "RSS") if hasattr(feed, "feed") else "RSS"
             # Enforce hard cap per feed
             cap = max(0, min(int(max_items_per_feed or 0), 15))
-            for entry in getattr(feed, "entries", [])[:cap]:
+            for entry in entries[:cap]:
                 title = entry.get("title", "Untitled")
                 link = entry.get("link") or entry.get("id") or ""
                 summary = entry.get("summary") or entry.get("description")
@@ -46,4 +147,6 @@ def fetch_from_rss(urls: Iterable[str], max_items_per_feed: int = 15) -> List[Ne
                 ))
         except Exception:
             continue
+    if skipped:
+        print(f"[RSS] Skipped {skipped} quarantined sources (see: python -m src.cli sources status)")
     return items
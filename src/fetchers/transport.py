@@ -0,0 +1,155 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "AINewsAgent/0.1 (+https://github.com/jhawaritvik/AINewsAgent)"
+
+
+def _accept_encoding() -> str:
+    # urllib3/httpx only decode brotli when one of these packages is installed
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+            return "gzip, deflate, br"
+        except ImportError:
+            continue
+    return "gzip, deflate"
+
+
+def _wire_size(resp: Any, decoded_size: int) -> int:
+    """Bytes actually received, before content decoding."""
+    downloaded = getattr(resp, "num_bytes_downloaded", None)  # httpx
+    if downloaded is not None:
+        return int(downloaded)
+    try:
+        return int(resp.raw.tell())  # urllib3 counts raw bytes read off the socket
+    except Exception:
+        return decoded_size
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0
+    bytes: int = 0        # decoded body size
+    wire_bytes: int = 0   # bytes received before gzip/br decoding
+    seconds: float = 0.0
+
+
+class Transport:
+    """Pooled, keep-alive HTTP client shared by every fetcher.
+
+    Uses an httpx HTTP/2 client when http2 is requested and httpx[http2] is
+    installed, otherwise a requests Session with a pool sized to pool_maxsize.
+    Both expose the same response attributes the fetchers rely on
+    (status_code, text, content, headers, url, json()).
+    """
+
+    def __init__(self, timeout: float = 15, pool_maxsize: int = 16, http2: bool = False, user_agent: str = USER_AGENT):
+        self.timeout = timeout
+        self.http2 = False
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+        headers = {"User-Agent": user_agent, "Accept-Encoding": _accept_encoding()}
+
+        if http2:
+            try:
+                import httpx
+                import h2  # noqa: F401  (httpx needs it for HTTP/2)
+                self._client = httpx.Client(
+                    http2=True,
+                    headers=headers,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+                )
+                self.http2 = True
+                return
+            except ImportError:
+                print("⚠️ HTTP/2 requested but httpx[http2] is not installed; using HTTP/1.1.")
+
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._client = session
+
+    def get(self, url: str, *, params: Optional[dict] = None, headers: Optional[dict] = None, timeout: Optional[float] = None) -> Any:
+        host = urlparse(url).netloc.lower()
+        start = time.perf_counter()
+        try:
+            resp = self._client.get(url, params=params, headers=headers, timeout=timeout or self.timeout)
+        except Exception:
+            self._record(host, time.perf_counter() - start, 0, 0, error=True)
+            raise
+        size = len(resp.content or b"")
+        self._record(host, time.perf_counter() - start, size, _wire_size(resp, size), error=resp.status_code >= 400)
+        return resp
+
+    def _record(self, host: str, seconds: float, size: int, wire_size: int, error: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.bytes += size
+            stats.wire_bytes += wire_size
+            stats.seconds += seconds
+
+    def stats(self) -> Dict[str, HostStats]:
+        with self._lock:
+            return {host: HostStats(**vars(s)) for host, s in self._stats.items()}
+
+    def summary(self, top: int = 5) -> str:
+        stats = self.stats()
+        total_req = sum(s.requests for s in stats.values())
+        total_err = sum(s.errors for s in stats.values())
+        total_bytes = sum(s.bytes for s in stats.values())
+        total_wire = sum(s.wire_bytes for s in stats.values())
+        total_sec = sum(s.seconds for s in stats.values())
+        lines = [
+            f"[HTTP] {total_req} requests ({total_err} errors), {total_wire / 1024:.1f} KiB on the wire "
+            f"({total_bytes / 1024:.1f} KiB decoded), {total_sec:.1f}s across {len(stats)} hosts"
+        ]
+        slowest = sorted(stats.items(), key=lambda kv: kv[1].seconds, reverse=True)[:top]
+        for host, s in slowest:
+            lines.append(f"[HTTP]   {host}: {s.requests} req, {s.wire_bytes / 1024:.1f}/{s.bytes / 1024:.1f} KiB wire/decoded, {s.seconds:.2f}s")
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def configure_transport(config: Dict[str, Any]) -> Transport:
+    """(Re)build the shared transport from the `http` and `options` config sections."""
+    global _transport
+    http_cfg = config.get("http", {}) or {}
+    timeout = float(http_cfg.get("timeout_sec") or config.get("options", {}).get("fetch_timeout_sec", 15))
+    transport = Transport(
+        timeout=timeout,
+        pool_maxsize=int(http_cfg.get("pool_maxsize", 16)),
+        http2=bool(http_cfg.get("http2", False)),
+        user_agent=http_cfg.get("user_agent") or USER_AGENT,
+    )
+    with _transport_lock:
+        old, _transport = _transport, transport
+    if old is not None:
+        old.close()
+    return transport
+
+
+def get_transport() -> Transport:
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = Transport()
+        return _transport
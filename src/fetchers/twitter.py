@@ -3,9 +3,9 @@ from datetime import datetime, timezone
 from urllib.parse import urlparse
 import random
 import re
-import feedparser
 
 from ..news_types import NewsItem
+from .rss import fetch_feed
 
 HANDLE_RE = re.compile(r"^(?:@)?([A-Za-z0-9_]{1,15})$")
 
@@ -31,6 +31,7 @@ def fetch_from_twitter(
     accounts: Iterable[str],
     nitter_instances: Iterable[str] | None = None,
     max_items_per_account: int = 15,
+    timeout: float | None = None,
 ) -> List[NewsItem]:
     items: List[NewsItem] = []
     instances = list(nitter_instances or [
@@ -51,7 +52,7 @@ def fetch_from_twitter(
         for base in instances:
             try:
                 rss_url = f"{base.rstrip('/')}/{handle}/rss"
-                feed = feedparser.parse(rss_url)
+                feed = fetch_feed(rss_url, timeout=timeout)
                 if getattr(feed, "entries", None):
                     break
             except Exception as e:
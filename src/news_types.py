@@ -12,3 +12,4 @@ class NewsItem:
     summary: Optional[str]
     image_url: Optional[str]
     score: float = 0.0
+    content: Optional[str] = None
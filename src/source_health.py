@@ -0,0 +1,185 @@
+from __future__ import annotations
+from dataclasses import dataclass, asdict, field, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+import json
+import os
+import threading
+
+OK = "ok"
+HTTP_ERROR = "http_error"
+NETWORK_ERROR = "network_error"
+PARSE_ERROR = "parse_error"
+EMPTY = "empty"
+
+_ROOT = os.path.dirname(os.path.dirname(__file__))
+
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    return dt.isoformat() if dt else None
+
+
+@dataclass
+class SourceRecord:
+    url: str
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    last_http_status: Optional[int] = None
+    last_latency_ms: Optional[float] = None
+    last_entries: int = 0
+    last_checked: Optional[str] = None
+    last_ok: Optional[str] = None
+    consecutive_failures: int = 0
+    total_checks: int = 0
+    total_failures: int = 0
+    skip_runs: int = 0
+    discovered_feed: Optional[str] = None
+    history: List[str] = field(default_factory=list)
+
+
+class SourceHealth:
+    """Per-source fetch outcomes persisted across runs.
+
+    A source that fails `failure_threshold` times in a row is quarantined and
+    skipped for an exponentially growing number of runs (doubling from
+    `base_skip_runs` up to `max_skip_runs`). One success clears it. The back-off
+    counts runs rather than hours so it behaves the same whatever the schedule.
+    """
+
+    def __init__(self, path: str, failure_threshold: int = 3, base_skip_runs: int = 1, max_skip_runs: int = 32, history_size: int = 10):
+        self.path = path
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.base_skip_runs = max(1, int(base_skip_runs))
+        self.max_skip_runs = max(self.base_skip_runs, int(max_skip_runs))
+        self.history_size = int(history_size)
+        self.records: Dict[str, SourceRecord] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SourceHealth":
+        cfg = config.get("health", {}) or {}
+        path = cfg.get("state_path") or ".ainews/source_health.json"
+        if not os.path.isabs(path):
+            path = os.path.join(_ROOT, path)
+        return cls(
+            path,
+            failure_threshold=cfg.get("failure_threshold", 3),
+            base_skip_runs=cfg.get("base_skip_runs", 1),
+            max_skip_runs=cfg.get("max_skip_runs", 32),
+        )
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f) or {}
+            # Ignore fields written by older versions (e.g. quarantined_until)
+            known = {f.name for f in fields(SourceRecord)}
+            self.records = {url: SourceRecord(**{k: v for k, v in rec.items() if k in known}) for url, rec in raw.items()}
+        except Exception as e:
+            print(f"⚠️ Could not read source health state {self.path}: {e}")
+            self.records = {}
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with self._lock:
+            state = {url: asdict(rec) for url, rec in self.records.items()}
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def feed_url(self, url: str) -> str:
+        """The URL to actually fetch: the auto-discovered feed if one is known."""
+        rec = self.records.get(url)
+        return rec.discovered_feed if rec and rec.discovered_feed else url
+
+    def is_quarantined(self, url: str) -> bool:
+        rec = self.records.get(url)
+        return bool(rec and rec.skip_runs > 0)
+
+    def skip(self, url: str) -> None:
+        """Count one run in which a quarantined source was not fetched."""
+        with self._lock:
+            rec = self.records.get(url)
+            if rec and rec.skip_runs > 0:
+                rec.skip_runs -= 1
+
+    def record(
+        self,
+        url: str,
+        status: str,
+        latency_ms: Optional[float] = None,
+        http_status: Optional[int] = None,
+        entries: int = 0,
+        error: Optional[str] = None,
+        discovered_feed: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> SourceRecord:
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            rec = self.records.setdefault(url, SourceRecord(url=url))
+            rec.last_status = status
+            rec.last_error = (error or "")[:300] or None
+            rec.last_http_status = http_status
+            rec.last_latency_ms = round(latency_ms, 1) if latency_ms is not None else None
+            rec.last_entries = int(entries)
+            rec.last_checked = _iso(now)
+            rec.total_checks += 1
+            if discovered_feed:
+                rec.discovered_feed = discovered_feed
+            rec.history = (rec.history + [status])[-self.history_size:]
+
+            if status == OK:
+                rec.last_ok = rec.last_checked
+                rec.consecutive_failures = 0
+                rec.skip_runs = 0
+                return rec
+
+            rec.total_failures += 1
+            rec.consecutive_failures += 1
+            if rec.consecutive_failures >= self.failure_threshold:
+                # A stale discovered feed may be what is failing; rediscover on re-check
+                if not discovered_feed:
+                    rec.discovered_feed = None
+                exponent = rec.consecutive_failures - self.failure_threshold
+                rec.skip_runs = min(self.max_skip_runs, self.base_skip_runs * (2 ** exponent))
+            return rec
+
+    def status_rows(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        for url in urls:
+            rec = self.records.get(url)
+            if rec is None:
+                rows.append({"url": url, "state": "unchecked"})
+                continue
+            state = "quarantined" if self.is_quarantined(url) else (rec.last_status or "unchecked")
+            rows.append({"state": state, **asdict(rec)})
+        return rows
+
+
+def format_status(rows: List[Dict[str, Any]]) -> str:
+    order = {"quarantined": 0, HTTP_ERROR: 1, NETWORK_ERROR: 1, PARSE_ERROR: 2, EMPTY: 3, "unchecked": 4, OK: 5}
+    rows = sorted(rows, key=lambda r: (order.get(r["state"], 9), r["url"]))
+    lines = [f"{'STATE':<13} {'FAILS':>5} {'ENTRIES':>7} {'LATENCY':>9}  URL"]
+    for r in rows:
+        latency = f"{r['last_latency_ms']:.0f}ms" if r.get("last_latency_ms") is not None else "-"
+        lines.append(f"{r['state']:<13} {r.get('consecutive_failures', 0):>5} {r.get('last_entries', 0):>7} {latency:>9}  {r['url']}")
+        details: List[str] = []
+        if r.get("discovered_feed"):
+            details.append(f"feed -> {r['discovered_feed']}")
+        if r["state"] == "quarantined":
+            runs = r["skip_runs"]
+            details.append(f"skipped for the next {runs} run{'s' if runs != 1 else ''}")
+        if r.get("last_error") and r["state"] != OK:
+            details.append(r["last_error"])
+        for d in details:
+            lines.append(f"{'':<38}{d}")
+    counts: Dict[str, int] = {}
+    for r in rows:
+        counts[r["state"]] = counts.get(r["state"], 0) + 1
+    lines.append("")
+    lines.append(", ".join(f"{k}: {v}" for k, v in sorted(counts.items())))
+    return "\n".join(lines)